@@ -15,7 +15,9 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 from slides_maker.application.ai_agent import SlidePlanner
 from slides_maker.application.image_service import build_image_service
+from slides_maker.application.plan_cache import build_plan_cache
 from slides_maker.application.ppt_builder import PPTBuilder
+from slides_maker.infrastructure.json_cache import build_chat_cache
 
 
 def parse_args() -> argparse.Namespace:
@@ -31,16 +33,15 @@ def main() -> None:
     output_path = Path(args.out)
     image_dir = Path(args.images)
 
-    planner = SlidePlanner()
+    planner = SlidePlanner(cache=build_chat_cache(), template_cache=build_plan_cache())
     plan = planner.generate_plan(args.topic)
 
     image_service = build_image_service(image_dir)
-    image_paths = []
-    for idx, slide in enumerate(plan.slides, start=1):
-        filename = f"slide_{idx:02d}.png"
-        image_path = image_service.generate_image(slide.image_prompt, filename)
-        image_paths.append(image_path)
-
+    pairs = [
+        (slide.image_prompt, f"slide_{idx:02d}.png")
+        for idx, slide in enumerate(plan.slides, start=1)
+    ]
+    image_paths = image_service.generate_images(pairs)
     builder = PPTBuilder()
     for slide, image_path in zip(plan.slides, image_paths):
         builder.add_slide(slide, image_path=image_path)
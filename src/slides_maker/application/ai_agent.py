@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-import json
+import sys
 from typing import Any, Dict
 
-from jsonschema import Draft202012Validator
+import fastjsonschema
+import orjson
 
-from slides_maker.domain.schemas import SLIDE_PLAN_SCHEMA, SlidePlanDict, to_slide_plan
+from slides_maker.application.plan_cache import PlanTemplateCache
+from slides_maker.domain.schemas import (
+    SLIDE_PLAN_SCHEMA,
+    VALIDATE_PLAN,
+    SlidePlanDict,
+    to_slide_plan,
+)
+from slides_maker.infrastructure.json_cache import JsonFileCache, make_key
 from slides_maker.infrastructure.openai_client import OpenAIClient
 
 
@@ -24,16 +32,60 @@ USER_PROMPT_TEMPLATE = (
 )
 
 
+TEMPERATURE = 0.4
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+SCHEMA_JSON = orjson.dumps(SLIDE_PLAN_SCHEMA).decode()
+
+
 class SlidePlanner:
-    def __init__(self, client: OpenAIClient | None = None) -> None:
+    def __init__(
+        self,
+        client: OpenAIClient | None = None,
+        cache: JsonFileCache | None = None,
+        template_cache: PlanTemplateCache | None = None,
+    ) -> None:
         self.client = client or OpenAIClient()
-        self.validator = Draft202012Validator(SLIDE_PLAN_SCHEMA)
+        self.cache = cache
+        self.template_cache = template_cache
+        self.repair_count = 0
+        self._validate = VALIDATE_PLAN
 
     def generate(self, topic: str) -> SlidePlanDict:
         prompt = USER_PROMPT_TEMPLATE.format(topic=topic)
-        response = self.client.chat(SYSTEM_PROMPT, prompt)
-        data = self._parse_json(response["content"])
+        key = make_key(self.client.model, SYSTEM_PROMPT, prompt, str(TEMPERATURE))
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None and self._is_valid(cached):
+                return cached
+        if self.template_cache is not None:
+            templated = self.template_cache.get(topic)
+            if templated is not None and self._is_valid(templated):
+                return templated
+
+        data = self._request_plan(topic, prompt)
+        if self.cache is not None:
+            self.cache.set(key, data)
+        if self.template_cache is not None:
+            self.template_cache.set(topic, data)
+        return data
+
+    def _request_plan(self, topic: str, prompt: str) -> SlidePlanDict:
+        response = self.client.chat(
+            SYSTEM_PROMPT,
+            prompt,
+            temperature=TEMPERATURE,
+            response_format=JSON_RESPONSE_FORMAT,
+        )
+        try:
+            data = self._parse_json(response["content"])
+        except ValueError:
+            data = {}
         if not self._is_valid(data):
+            self.repair_count += 1
+            print(
+                f"AI output failed validation; requesting repair (repairs: {self.repair_count}).",
+                file=sys.stderr,
+            )
             repaired = self._repair_json(topic, response["content"])
             if not self._is_valid(repaired):
                 raise ValueError("AI output is invalid after repair")
@@ -45,11 +97,14 @@ class SlidePlanner:
 
     def _parse_json(self, content: str) -> Dict[str, Any]:
         content = content.strip()
-        return json.loads(content)
+        return orjson.loads(content)
 
     def _is_valid(self, data: Dict[str, Any]) -> bool:
-        errors = list(self.validator.iter_errors(data))
-        return len(errors) == 0
+        try:
+            self._validate(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
 
     def _repair_json(self, topic: str, bad_output: str) -> Dict[str, Any]:
         repair_prompt = (
@@ -58,6 +113,11 @@ class SlidePlanner:
             "Schema reminder: {schema}\n"
             "Invalid output: {bad_output}\n"
             "Topic: {topic}"
-        ).format(schema=json.dumps(SLIDE_PLAN_SCHEMA), bad_output=bad_output, topic=topic)
-        response = self.client.chat(SYSTEM_PROMPT, repair_prompt)
+        ).format(schema=SCHEMA_JSON, bad_output=bad_output, topic=topic)
+        response = self.client.chat(
+            SYSTEM_PROMPT,
+            repair_prompt,
+            temperature=TEMPERATURE,
+            response_format=JSON_RESPONSE_FORMAT,
+        )
         return self._parse_json(response["content"])
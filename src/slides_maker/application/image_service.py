@@ -1,21 +1,44 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import io
 import os
+import random
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import Iterator, Protocol, Sequence
 from urllib.parse import quote_plus
 
 import httpx
 from PIL import Image, ImageDraw, ImageFont
 
+from slides_maker.infrastructure.http_client import get_http_client, stream_to_file
+from slides_maker.infrastructure.json_cache import make_key
 from slides_maker.infrastructure.openai_client import OpenAIClient
 
 
+_REQUIRE_REAL_IMAGES = os.environ.get("REQUIRE_REAL_IMAGES", "0") == "1"
+_USE_OPENAI_IMAGES = os.environ.get("USE_OPENAI_IMAGES", "0") == "1"
+
+try:
+    _PLACEHOLDER_FONT = ImageFont.load_default()
+except Exception:
+    _PLACEHOLDER_FONT = None
+_PLACEHOLDER_BASE = Image.new("RGB", (1024, 1024), color=(240, 240, 240))
+
+
 class ImageProvider(Protocol):
-    def generate(self, prompt: str) -> bytes:
+    @property
+    def provider_id(self) -> str:
+        ...
+
+    def generate(self, prompt: str, target: Path) -> None:
         ...
 
 
@@ -23,33 +46,139 @@ class OpenAIImageProvider:
     def __init__(self, client: OpenAIClient | None = None) -> None:
         self.client = client or OpenAIClient()
 
-    def generate(self, prompt: str) -> bytes:
-        return self.client.images(prompt=prompt)
+    @property
+    def provider_id(self) -> str:
+        return f"openai-{self.client.image_model}"
+
+    def generate(self, prompt: str, target: Path) -> None:
+        self.client.images(prompt=prompt, target=target)
 
 
 class StockImageProvider:
-    def generate(self, prompt: str) -> bytes:
-        seed = abs(hash(prompt)) % 10_000
+    provider_id = "picsum"
+
+    def generate(self, prompt: str, target: Path) -> None:
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=4).digest()
+        seed = int.from_bytes(digest, "big") % 10_000
         url = f"https://picsum.photos/seed/{seed}/1024/1024"
-        return _fetch_image_bytes(url)
+        _download_image(url, target, follow_redirects=True)
 
 
 class UnsplashImageProvider:
-    def generate(self, prompt: str) -> bytes:
+    provider_id = "unsplash"
+
+    def generate(self, prompt: str, target: Path) -> None:
         query = quote_plus(prompt)
         url = f"https://source.unsplash.com/featured/1024x1024/?{query}"
-        return _fetch_image_bytes(url, follow_redirects=True)
+        _download_image(url, target, follow_redirects=True)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreakerProvider:
+    def __init__(
+        self, inner: ImageProvider, failure_threshold: int = 3, reset_timeout: float = 30.0
+    ) -> None:
+        self.inner = inner
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def provider_id(self) -> str:
+        return self.inner.provider_id
+
+    def generate(self, prompt: str, target: Path) -> None:
+        trial = self._before_call()
+        try:
+            self.inner.generate(prompt, target)
+        except Exception as exc:
+            if not _is_client_error(exc):
+                with self._lock:
+                    self.failures += 1
+                    if trial or self.failures >= self.failure_threshold:
+                        self.state = "open"
+                        self.opened_at = time.monotonic()
+            raise
+        else:
+            with self._lock:
+                self.state = "closed"
+                self.failures = 0
+        finally:
+            if trial:
+                with self._lock:
+                    self._trial_in_flight = False
+
+    def _before_call(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return False
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.provider_id} circuit is open")
+                self.state = "half_open"
+            if self._trial_in_flight:
+                raise CircuitOpenError(f"{self.provider_id} circuit is half-open")
+            self._trial_in_flight = True
+            return True
+
+
+class ConcurrencyLimitedProvider:
+    def __init__(self, inner: ImageProvider, max_concurrency: int) -> None:
+        self.inner = inner
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+
+    @property
+    def provider_id(self) -> str:
+        return self.inner.provider_id
+
+    def generate(self, prompt: str, target: Path) -> None:
+        with self._semaphore:
+            self.inner.generate(prompt, target)
+
+
+class CachedImageProvider:
+    def __init__(self, inner: ImageProvider, cache_dir: Path) -> None:
+        self.inner = inner
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def provider_id(self) -> str:
+        return self.inner.provider_id
+
+    def generate(self, prompt: str, target: Path) -> None:
+        cache_path = self.cache_dir / f"{make_key(self.provider_id, prompt)}.png"
+        if not cache_path.exists():
+            tmp = cache_path.with_suffix(f".{threading.get_ident()}.part")
+            try:
+                self.inner.generate(prompt, tmp)
+                os.replace(tmp, cache_path)
+            finally:
+                tmp.unlink(missing_ok=True)
+        shutil.copyfile(cache_path, target)
 
 
 class ChainedImageProvider:
     def __init__(self, providers: list[ImageProvider]) -> None:
         self.providers = providers
 
-    def generate(self, prompt: str) -> bytes:
+    @property
+    def provider_id(self) -> str:
+        return "+".join(provider.provider_id for provider in self.providers)
+
+    def generate(self, prompt: str, target: Path) -> None:
         last_exc: Exception | None = None
         for provider in self.providers:
             try:
-                return provider.generate(prompt)
+                provider.generate(prompt, target)
+                return
             except Exception as exc:
                 last_exc = exc
         if last_exc is not None:
@@ -57,19 +186,46 @@ class ChainedImageProvider:
         raise RuntimeError("No image providers configured")
 
 
-def _fetch_image_bytes(url: str, follow_redirects: bool = False) -> bytes:
+def _is_client_error(exc: Exception) -> bool:
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    return 400 <= status < 500 and status != 429
+
+
+def _download_image(
+    url: str,
+    target: Path,
+    follow_redirects: bool = False,
+    max_retries: int = 3,
+    backoff_base: float = 0.25,
+    backoff_jitter: float = 0.25,
+) -> None:
     headers = {
         "User-Agent": "slides-maker/1.0 (+https://github.com/suman98/slide-gen-ai)",
         "Accept": "image/*,*/*;q=0.8",
     }
     timeout = httpx.Timeout(15.0, connect=10.0)
     last_exc: Exception | None = None
-    for _ in range(3):
+    client = get_http_client()
+    for attempt in range(max_retries):
+        if attempt > 0:
+            time.sleep(backoff_base * 2 ** (attempt - 1) + random.uniform(0, backoff_jitter))
         try:
-            with httpx.Client(timeout=timeout, follow_redirects=follow_redirects, headers=headers) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.content
+            stream_to_file(
+                client,
+                url,
+                target,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+            )
+            return
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            if status < 500 and status != 429:
+                raise
+            last_exc = exc
         except Exception as exc:
             last_exc = exc
     if last_exc is not None:
@@ -83,39 +239,40 @@ class ImageService:
     primary: ImageProvider
     fallback: ImageProvider | None = None
 
-    def generate_image(self, prompt: str, filename: str) -> Path:
+    def __post_init__(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_image(self, prompt: str, filename: str) -> Path:
         target = self.output_dir / filename
         try:
-            content = self.primary.generate(prompt)
+            self.primary.generate(prompt, target)
+            return target
         except Exception:
-            if self.fallback is not None:
-                try:
-                    content = self.fallback.generate(prompt)
-                except Exception:
-                    content = self._handle_image_failure(prompt)
-            else:
-                content = self._handle_image_failure(prompt)
-
-        target.write_bytes(content)
+            pass
+        if self.fallback is not None:
+            try:
+                self.fallback.generate(prompt, target)
+                return target
+            except Exception:
+                pass
+
+        target.write_bytes(self._handle_image_failure(prompt))
         return target
 
+    def generate_images(self, pairs: Sequence[tuple[str, str]]) -> Iterator[Path]:
+        prompts = [prompt for prompt, _ in pairs]
+        filenames = [filename for _, filename in pairs]
+        executor = ThreadPoolExecutor(max_workers=max(len(pairs), 1))
+        results = executor.map(self.generate_image, prompts, filenames)
+        executor.shutdown(wait=False)
+        return results
+
     def _placeholder_image(self, prompt: str) -> bytes:
-        image = Image.new("RGB", (1024, 1024), color=(240, 240, 240))
-        draw = ImageDraw.Draw(image)
         text = (prompt[:60] + "...") if len(prompt) > 60 else prompt
-        try:
-            font = ImageFont.load_default()
-        except Exception:
-            font = None
-        draw.text((40, 40), text, fill=(60, 60, 60), font=font)
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        return buffer.getvalue()
+        return _render_placeholder(text)
 
     def _handle_image_failure(self, prompt: str) -> bytes:
-        require_real = os.environ.get("REQUIRE_REAL_IMAGES", "0") == "1"
-        if require_real:
+        if _REQUIRE_REAL_IMAGES:
             raise RuntimeError(
                 "Image generation failed. Disable REQUIRE_REAL_IMAGES or allow placeholders."
             )
@@ -127,15 +284,39 @@ class ImageService:
         return self._placeholder_image(prompt)
 
 
+@functools.lru_cache(maxsize=128)
+def _render_placeholder(text: str) -> bytes:
+    image = _PLACEHOLDER_BASE.copy()
+    draw = ImageDraw.Draw(image)
+    draw.text((40, 40), text, fill=(60, 60, 60), font=_PLACEHOLDER_FONT)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=1, optimize=False)
+    return buffer.getvalue()
+
+
 def build_image_service(output_dir: Path) -> ImageService:
-    use_openai = os.environ.get("USE_OPENAI_IMAGES", "0") == "1"
+    cache_dir = output_dir / ".cache"
     primary: ImageProvider
-    if use_openai:
+    if _USE_OPENAI_IMAGES:
         primary = ChainedImageProvider(
-            [OpenAIImageProvider(), UnsplashImageProvider(), StockImageProvider()]
+            [
+                CachedImageProvider(
+                    ConcurrencyLimitedProvider(
+                        CircuitBreakerProvider(OpenAIImageProvider()), max_concurrency=4
+                    ),
+                    cache_dir,
+                ),
+                CachedImageProvider(CircuitBreakerProvider(UnsplashImageProvider()), cache_dir),
+                CachedImageProvider(CircuitBreakerProvider(StockImageProvider()), cache_dir),
+            ]
         )
         fallback: ImageProvider | None = None
     else:
-        primary = ChainedImageProvider([UnsplashImageProvider(), StockImageProvider()])
+        primary = ChainedImageProvider(
+            [
+                CachedImageProvider(CircuitBreakerProvider(UnsplashImageProvider()), cache_dir),
+                CachedImageProvider(CircuitBreakerProvider(StockImageProvider()), cache_dir),
+            ]
+        )
         fallback = None
     return ImageService(output_dir=output_dir, primary=primary, fallback=fallback)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import copy
+import re
+from pathlib import Path
+
+from slides_maker.domain.schemas import SlidePlanDict
+from slides_maker.infrastructure.json_cache import (
+    DEFAULT_CACHE_ROOT,
+    JsonFileCache,
+    cache_enabled,
+    make_key,
+)
+
+
+STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "the", "of", "to", "in", "on", "for", "with", "by",
+        "about", "from", "into", "vs", "versus", "your", "our", "how", "what",
+        "why", "intro", "introduction", "overview", "basics", "fundamentals",
+        "guide", "primer", "beginner", "beginners", "101",
+    }
+)
+
+TOPIC_FIELD = "{topic}"
+MIN_KEYWORD_LENGTH = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _stem(token: str) -> str:
+    if token.endswith("sses"):
+        token = token[:-2]
+    elif token.endswith("ies") and len(token) > 4:
+        token = token[:-3] + "y"
+    elif token.endswith("s") and not token.endswith("ss") and len(token) > 3:
+        token = token[:-1]
+    if token.endswith("ing") and len(token) >= 6:
+        token = token[:-3]
+    return token
+
+
+def topic_keyword(topic: str) -> str:
+    tokens = {_stem(t) for t in _TOKEN_RE.findall(topic.lower()) if t not in STOPWORDS}
+    keyword = " ".join(sorted(tokens))
+    if len(keyword) < MIN_KEYWORD_LENGTH:
+        return ""
+    return keyword
+
+
+def _generalize(text: str, topic: str) -> str:
+    text = text.replace("{", "{{").replace("}", "}}")
+    return re.sub(re.escape(topic), TOPIC_FIELD, text, flags=re.IGNORECASE)
+
+
+def _specialize(text: str, topic: str) -> str:
+    return text.format(topic=topic)
+
+
+class PlanTemplateCache:
+    def __init__(self, store: JsonFileCache) -> None:
+        self.store = store
+
+    def get(self, topic: str) -> SlidePlanDict | None:
+        keyword = topic_keyword(topic)
+        if not keyword:
+            return None
+        template = self.store.get(make_key(keyword))
+        if template is None:
+            return None
+        try:
+            plan = copy.deepcopy(template)
+            plan["topic"] = topic
+            for slide in plan["slides"]:
+                slide["heading"] = _specialize(slide["heading"], topic)
+                slide["image_prompt"] = _specialize(slide["image_prompt"], topic)
+                slide["bullet_points"] = [
+                    _specialize(point, topic) for point in slide["bullet_points"]
+                ]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+        return plan
+
+    def set(self, topic: str, plan: SlidePlanDict) -> None:
+        keyword = topic_keyword(topic)
+        if not keyword:
+            return
+        template = copy.deepcopy(plan)
+        template["topic"] = TOPIC_FIELD
+        for slide in template["slides"]:
+            slide["heading"] = _generalize(slide["heading"], topic)
+            slide["image_prompt"] = _generalize(slide["image_prompt"], topic)
+            slide["bullet_points"] = [
+                _generalize(point, topic) for point in slide["bullet_points"]
+            ]
+        self.store.set(make_key(keyword), template)
+
+
+def build_plan_cache(root: Path = DEFAULT_CACHE_ROOT) -> PlanTemplateCache | None:
+    if not cache_enabled():
+        return None
+    return PlanTemplateCache(JsonFileCache(root / "plans"))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable
 
+from PIL import Image
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
@@ -11,8 +13,23 @@ from slides_maker.domain.schemas import Slide
 
 
 class PPTBuilder:
+    TEXT_LEFT = Inches(0.7)
+    TEXT_TOP = Inches(1.6)
+    TEXT_WIDTH = Inches(5.4)
+    TEXT_HEIGHT = Inches(4.6)
+    IMAGE_LEFT = Inches(6.4)
+    IMAGE_TOP = Inches(1.6)
+    IMAGE_WIDTH = Inches(3.1)
+    BULLET_FONT_SIZE = Pt(20)
+    IMAGE_MAX_PX = 1000
+    IMAGE_JPEG_QUALITY = 85
+
     def __init__(self) -> None:
         self.presentation = Presentation()
+        layouts = self.presentation.slide_layouts
+        self._layout_title = layouts[0]
+        self._layout_section = layouts[2]
+        self._layout_content = layouts[5]
 
     def add_slide(self, slide: Slide, image_path: Path | None = None) -> None:
         if slide.slide_type == "title":
@@ -27,16 +44,14 @@ class PPTBuilder:
         self.presentation.save(str(path))
 
     def _add_title_slide(self, slide: Slide) -> None:
-        layout = self.presentation.slide_layouts[0]
-        s = self.presentation.slides.add_slide(layout)
+        s = self.presentation.slides.add_slide(self._layout_title)
         s.shapes.title.text = slide.heading
         if len(slide.bullet_points) > 0:
             subtitle = s.placeholders[1]
             subtitle.text = "\n".join(slide.bullet_points)
 
     def _add_section_slide(self, slide: Slide) -> None:
-        layout = self.presentation.slide_layouts[2]
-        s = self.presentation.slides.add_slide(layout)
+        s = self.presentation.slides.add_slide(self._layout_section)
         s.shapes.title.text = slide.heading
         body = s.placeholders[1].text_frame
         body.clear()
@@ -46,26 +61,45 @@ class PPTBuilder:
             p.level = 0
 
     def _add_content_slide(self, slide: Slide, image_path: Path | None) -> None:
-        layout = self.presentation.slide_layouts[5]
-        s = self.presentation.slides.add_slide(layout)
+        s = self.presentation.slides.add_slide(self._layout_content)
         title = s.shapes.title
         title.text = slide.heading
 
-        left = Inches(0.7)
-        top = Inches(1.6)
-        width = Inches(5.4)
-        height = Inches(4.6)
-        textbox = s.shapes.add_textbox(left, top, width, height)
+        textbox = s.shapes.add_textbox(
+            self.TEXT_LEFT, self.TEXT_TOP, self.TEXT_WIDTH, self.TEXT_HEIGHT
+        )
         tf = textbox.text_frame
         tf.word_wrap = True
         for i, point in enumerate(slide.bullet_points):
             p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
             p.text = point
             p.level = 0
-            p.font.size = Pt(20)
+            p.font.size = self.BULLET_FONT_SIZE
 
         if image_path is not None and image_path.exists():
-            s.shapes.add_picture(str(image_path), Inches(6.4), Inches(1.6), width=Inches(3.1))
+            s.shapes.add_picture(
+                self._downsample(image_path),
+                self.IMAGE_LEFT,
+                self.IMAGE_TOP,
+                width=self.IMAGE_WIDTH,
+            )
+
+    def _downsample(self, image_path: Path) -> IO[bytes] | str:
+        buffer = io.BytesIO()
+        try:
+            with Image.open(image_path) as img:
+                img.thumbnail((self.IMAGE_MAX_PX, self.IMAGE_MAX_PX), Image.LANCZOS)
+                if img.mode in ("RGBA", "LA") or "transparency" in img.info:
+                    rgba = img.convert("RGBA")
+                    flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+                    flattened.paste(rgba, mask=rgba.getchannel("A"))
+                else:
+                    flattened = img.convert("RGB")
+                flattened.save(buffer, format="JPEG", quality=self.IMAGE_JPEG_QUALITY)
+        except OSError:
+            return str(image_path)
+        buffer.seek(0)
+        return buffer
 
 
 def build_presentation(slides: Iterable[Slide], image_paths: list[Path]) -> Presentation:
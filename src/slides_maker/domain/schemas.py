@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Literal, TypedDict
 
+import fastjsonschema
+
 
 SlideType = Literal["title", "section", "content"]
 
@@ -51,7 +53,10 @@ SLIDE_PLAN_SCHEMA = {
 }
 
 
-@dataclass
+VALIDATE_PLAN = fastjsonschema.compile(SLIDE_PLAN_SCHEMA)
+
+
+@dataclass(slots=True)
 class Slide:
     slide_type: SlideType
     heading: str
@@ -59,20 +64,12 @@ class Slide:
     image_prompt: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SlidePlan:
     topic: str
     slides: List[Slide]
 
 
 def to_slide_plan(data: SlidePlanDict) -> SlidePlan:
-    slides = [
-        Slide(
-            slide_type=slide["slide_type"],
-            heading=slide["heading"],
-            bullet_points=slide["bullet_points"],
-            image_prompt=slide["image_prompt"],
-        )
-        for slide in data["slides"]
-    ]
+    slides = [Slide(**slide) for slide in data["slides"]]
     return SlidePlan(topic=data["topic"], slides=slides)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    global _client
+    with _lock:
+        if _client is None:
+            _client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            atexit.register(_client.close)
+        return _client
+
+
+def stream_to_file(
+    client: httpx.Client, url: str, target: Path, chunk_size: int = 65536, **kwargs: Any
+) -> None:
+    with client.stream("GET", url, **kwargs) as response:
+        response.raise_for_status()
+        with open(target, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size):
+                f.write(chunk)
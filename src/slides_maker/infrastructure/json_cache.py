@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_CACHE_ROOT = Path.home() / ".cache" / "slides_maker"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("SLIDES_CACHE", "0") == "1"
+
+
+def make_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class JsonFileCache:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def get(self, key: str) -> Any | None:
+        path = self.directory / f"{key}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(value), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def build_chat_cache(root: Path = DEFAULT_CACHE_ROOT) -> JsonFileCache | None:
+    if not cache_enabled():
+        return None
+    return JsonFileCache(root / "chat")
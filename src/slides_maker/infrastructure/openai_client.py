@@ -1,54 +1,79 @@
 from __future__ import annotations
 
-import json
+import base64
 import os
+from pathlib import Path
 from typing import Any, Dict, List
 
 import httpx
+import orjson
+
+from slides_maker.infrastructure.http_client import get_http_client, stream_to_file
 
 
 class OpenAIClient:
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.Client | None = None) -> None:
+        self.http = http_client or get_http_client()
         self.api_key = os.environ.get("OPENAI_API_KEY", "").strip()
         self.base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
         self.model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip()
+        self.image_model = os.environ.get("OPENAI_IMAGE_MODEL", "").strip() or "gpt-image-1"
         if not self.api_key:
             raise RuntimeError("OPENAI_API_KEY is required")
 
-    def chat(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+    def chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.4,
+        response_format: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
         url = f"{self.base_url}/chat/completions"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         payload = {
             "model": self.model,
-            "temperature": 0.4,
+            "temperature": temperature,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
         }
-        with httpx.Client(timeout=60) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        if response_format is not None:
+            payload["response_format"] = response_format
+        response = self.http.post(
+            url, headers=headers, content=orjson.dumps(payload), timeout=60
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         content = data["choices"][0]["message"]["content"]
         return {"content": content, "raw": data}
 
-    def images(self, prompt: str, size: str = "1024x1024") -> bytes:
+    def images(self, prompt: str, target: Path, size: str = "1024x1024") -> None:
         url = f"{self.base_url}/images/generations"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         payload = {
-            "model": os.environ.get("OPENAI_IMAGE_MODEL", "").strip() or "gpt-image-1",
+            "model": self.image_model,
             "prompt": prompt,
             "size": size,
         }
-        with httpx.Client(timeout=120) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        image_url = data["data"][0].get("url")
+        if self.image_model.startswith("dall-e"):
+            payload["response_format"] = "b64_json"
+        response = self.http.post(
+            url, headers=headers, content=orjson.dumps(payload), timeout=120
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        image = data["data"][0]
+        if image.get("b64_json"):
+            target.write_bytes(base64.b64decode(image["b64_json"]))
+            return
+        image_url = image.get("url")
         if not image_url:
-            raise RuntimeError("Image URL missing in response")
-        with httpx.Client(timeout=120) as client:
-            image_resp = client.get(image_url)
-            image_resp.raise_for_status()
-            return image_resp.content
+            raise RuntimeError("Image data missing in response")
+        stream_to_file(self.http, image_url, target, timeout=120)